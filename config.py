@@ -4,6 +4,15 @@ Configuration file for Grantentic Grant Writing System
 import os
 from typing import Optional
 
+
+def _env_int(name: str, default: int) -> int:
+    """Integer env var, falling back to the default when unset or malformed."""
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
 class Config:
     """Application configuration"""
 
@@ -20,7 +29,7 @@ class Config:
     # ============================================================================
     # SUPABASE DATABASE
     # ============================================================================
-    # The app authenticates users itself (SHA-256 + salt in src/auth.py) and
+    # The app authenticates users itself (PBKDF2-SHA256 + salt in src/auth.py) and
     # makes every database call from the server, so we use the service_role key
     # for all queries. service_role bypasses RLS, which is correct here because
     # the app — not Supabase Auth — gates which rows each user can access.
@@ -99,6 +108,7 @@ class Config:
     # ============================================================================
     # Set your target funding agency here
     # Options: 'nsf', 'dod', 'nasa'
+    # Example: export GRANT_AGENCY=dod
     AGENCY = os.environ.get('GRANT_AGENCY', 'nsf').lower()
 
     # ============================================================================
@@ -114,6 +124,7 @@ class Config:
     # ============================================================================
     # Model to use for grant generation
     # Options: 'claude-sonnet-4-5', 'claude-opus-4'
+    # Example: export AI_MODEL=claude-opus-4
     MODEL = os.environ.get('AI_MODEL', 'claude-sonnet-4-5')
 
     # Maximum tokens for generation (affects cost and output length)
@@ -136,7 +147,8 @@ class Config:
     # ============================================================================
     # OUTPUT SETTINGS
     # ============================================================================
-    OUTPUT_DIR = 'outputs'
+    # Example: export OUTPUT_DIR=/path/to/outputs
+    OUTPUT_DIR = os.environ.get('OUTPUT_DIR', 'outputs')
 
     # Include metadata in document footer
     INCLUDE_METADATA = True
@@ -155,8 +167,14 @@ class Config:
     # Every NSF product runs full-quality generation at this level.
     DEFAULT_ITERATIONS = 2
 
-    # Enable parallel section generation (not yet implemented)
-    PARALLEL_GENERATION = False
+    # Generate independent sections concurrently instead of one after another.
+    # Off by default: each section fans out into several Claude calls, so
+    # parallel runs multiply the request rate against the API.
+    PARALLEL_GENERATION = os.environ.get('PARALLEL_GENERATION', 'false').strip().lower() in ('1', 'true', 'yes', 'on')
+
+    # Upper bound on sections in flight when PARALLEL_GENERATION is on.
+    # At least 1, since it sizes a ThreadPoolExecutor.
+    MAX_PARALLEL_SECTIONS = max(1, _env_int('MAX_PARALLEL_SECTIONS', 4))
 
     # ============================================================================
     # AGENCY PROFILES
@@ -239,23 +257,3 @@ class Config:
         print(f"Duration: {info['duration_months']} months")
         print(f"{'='*70}\n")
 
-
-# ============================================================================
-# ENVIRONMENT-SPECIFIC OVERRIDES
-# ============================================================================
-# These can be set via environment variables
-
-# Override agency selection
-# Example: export GRANT_AGENCY=dod
-if 'GRANT_AGENCY' in os.environ:
-    Config.AGENCY = os.environ['GRANT_AGENCY'].lower()
-
-# Override model selection
-# Example: export AI_MODEL=claude-opus-4
-if 'AI_MODEL' in os.environ:
-    Config.MODEL = os.environ['AI_MODEL']
-
-# Override output directory
-# Example: export OUTPUT_DIR=/path/to/outputs
-if 'OUTPUT_DIR' in os.environ:
-    Config.OUTPUT_DIR = os.environ['OUTPUT_DIR']
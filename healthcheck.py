@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-Health check script for Streamlit deployment
+Health check script for the web app deployment
 Tests if the app is responding to requests
 """
 
@@ -8,12 +8,15 @@ import requests
 import sys
 import time
 
-def check_health(url="http://localhost:8501", timeout=10, max_retries=3):
+def check_health(url="http://localhost:8000/health", timeout=10, max_retries=3):
     """
-    Check if Streamlit app is responding
+    Check if the web app is responding
+
+    Probes the lightweight /health route rather than the landing page, so
+    the check doesn't pay for template rendering or database queries.
 
     Args:
-        url: URL to check (default: localhost:8501)
+        url: URL to check (default: localhost:8000/health)
         timeout: Request timeout in seconds
         max_retries: Number of retries before failing
 
@@ -22,29 +25,32 @@ def check_health(url="http://localhost:8501", timeout=10, max_retries=3):
     """
     print(f"Checking health of {url}...")
 
-    for attempt in range(1, max_retries + 1):
-        try:
-            print(f"Attempt {attempt}/{max_retries}...")
-            response = requests.get(url, timeout=timeout, allow_redirects=True)
+    # One session for all attempts so retries reuse the pooled connection
+    # instead of reconnecting each time.
+    with requests.Session() as session:
+        for attempt in range(1, max_retries + 1):
+            try:
+                print(f"Attempt {attempt}/{max_retries}...")
+                response = session.get(url, timeout=timeout, allow_redirects=True)
 
-            if response.status_code == 200:
-                print(f"✓ Health check passed! Status code: {response.status_code}")
-                print(f"✓ App is responding correctly")
-                return True
-            else:
-                print(f"⚠ Unexpected status code: {response.status_code}")
+                if response.status_code == 200:
+                    print(f"✓ Health check passed! Status code: {response.status_code}")
+                    print(f"✓ App is responding correctly")
+                    return True
+                else:
+                    print(f"⚠ Unexpected status code: {response.status_code}")
 
-        except requests.exceptions.ConnectionError:
-            print(f"✗ Connection error - app may not be running")
-        except requests.exceptions.Timeout:
-            print(f"✗ Request timed out after {timeout} seconds")
-        except Exception as e:
-            print(f"✗ Error: {e}")
+            except requests.exceptions.ConnectionError:
+                print(f"✗ Connection error - app may not be running")
+            except requests.exceptions.Timeout:
+                print(f"✗ Request timed out after {timeout} seconds")
+            except Exception as e:
+                print(f"✗ Error: {e}")
 
-        if attempt < max_retries:
-            wait_time = 2 * attempt
-            print(f"  Waiting {wait_time} seconds before retry...")
-            time.sleep(wait_time)
+            if attempt < max_retries:
+                wait_time = 2 * attempt
+                print(f"  Waiting {wait_time} seconds before retry...")
+                time.sleep(wait_time)
 
     print(f"✗ Health check failed after {max_retries} attempts")
     return False
@@ -53,7 +59,7 @@ def check_health(url="http://localhost:8501", timeout=10, max_retries=3):
 def main():
     """Main health check function"""
     print("="*60)
-    print("Streamlit Health Check")
+    print("Grantentic Health Check")
     print("="*60)
 
     # Check localhost
@@ -63,8 +69,8 @@ def main():
     else:
         print("\n✗ Health check failed!")
         print("\nTroubleshooting steps:")
-        print("1. Ensure Streamlit is running: streamlit run app.py")
-        print("2. Check if port 8501 is available: lsof -i :8501")
+        print("1. Ensure the app is running: python webapp.py")
+        print("2. Check if port 8000 is available: lsof -i :8000")
         print("3. Check logs for errors")
         print("4. Try restarting the application")
         sys.exit(1)
@@ -2,7 +2,7 @@
 Agency Requirements Loader
 Loads agency-specific requirements, page limits, and evaluation criteria
 """
-import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 from pydantic import BaseModel, Field
@@ -10,6 +10,13 @@ from rich.console import Console
 
 console = Console()
 
+# Agency code -> directory under agency_templates/
+_AGENCY_DIRS = {
+    'nsf': 'nsf',
+    'dod': 'dod',
+    'nasa': 'nasa',
+}
+
 
 class SectionRequirements(BaseModel):
     """Requirements for a single proposal section"""
@@ -25,6 +32,16 @@ class SectionRequirements(BaseModel):
     required_keywords: list[str]
     description: str
 
+    @property
+    def target_length(self) -> str:
+        """Length target passed to the generator — the character limit if
+        defined, otherwise the page range."""
+        if self.max_chars > 0:
+            return f"{self.max_chars:,} characters"
+        if self.min_pages == self.max_pages:
+            return f"{self.min_pages} pages"
+        return f"{self.min_pages}-{self.max_pages} pages"
+
 
 class EvaluationCriterion(BaseModel):
     """Evaluation criterion with weight and description"""
@@ -56,8 +73,8 @@ class AgencyRequirements(BaseModel):
     sections: Dict[str, SectionRequirements]
     evaluation_criteria: Dict[str, EvaluationCriterion]
     format_specifications: FormatSpecifications
-    special_requirements: Dict[str, Any]
-    submission_requirements: Dict[str, str]
+    special_requirements: Dict[str, Any] = {}
+    submission_requirements: Dict[str, str] = {}
 
 
 class AgencyLoader:
@@ -67,22 +84,24 @@ class AgencyLoader:
         self.agency = agency.lower()
         self.templates_dir = Path(templates_dir)
         self.requirements: Optional[AgencyRequirements] = None
+        # Derived views, built on first use. Loaders are shared between
+        # requests (see load_agency_requirements), so callers must not mutate
+        # what the getters return.
+        self._ordered_sections: Optional[list[tuple[str, SectionRequirements]]] = None
+        self._page_limits: Optional[Dict[str, tuple]] = None
+        self._required_keywords: Optional[Dict[str, list[str]]] = None
+        self._requirements_text: Optional[str] = None
+        self._section_guidelines: Optional[Dict[str, str]] = None
         self._load_requirements()
 
     def _load_requirements(self):
         """Load requirements from JSON file"""
-        # Map agency to directory
-        agency_map = {
-            'nsf': 'nsf',
-            'dod': 'dod',
-            'nasa': 'nasa'
-        }
-
-        if self.agency not in agency_map:
-            raise ValueError(f"Unknown agency: {self.agency}. Supported: {list(agency_map.keys())}")
+        agency_dir = _AGENCY_DIRS.get(self.agency)
+        if agency_dir is None:
+            raise ValueError(f"Unknown agency: {self.agency}. Supported: {list(_AGENCY_DIRS)}")
 
         # Construct path to requirements file
-        requirements_file = self.templates_dir / agency_map[self.agency] / 'requirements.json'
+        requirements_file = self.templates_dir / agency_dir / 'requirements.json'
 
         if not requirements_file.exists():
             raise FileNotFoundError(f"Requirements file not found: {requirements_file}")
@@ -90,37 +109,11 @@ class AgencyLoader:
         # Load and parse JSON
         console.print(f"[cyan]Loading {self.agency.upper()} requirements from {requirements_file}[/cyan]")
 
-        with open(requirements_file, 'r') as f:
-            data = json.load(f)
-
-        # Convert sections to SectionRequirements objects
-        sections = {}
-        for key, section_data in data['sections'].items():
-            sections[key] = SectionRequirements(**section_data)
-
-        # Convert evaluation criteria
-        eval_criteria = {}
-        for key, criterion_data in data['evaluation_criteria'].items():
-            eval_criteria[key] = EvaluationCriterion(**criterion_data)
-
-        # Convert format specifications
-        format_specs = FormatSpecifications(**data['format_specifications'])
-
-        # Create AgencyRequirements object
-        self.requirements = AgencyRequirements(
-            agency=data['agency'],
-            program=data['program'],
-            funding_amount=data['funding_amount'],
-            duration_months=data['duration_months'],
-            description=data['description'],
-            sections=sections,
-            evaluation_criteria=eval_criteria,
-            format_specifications=format_specs,
-            special_requirements=data.get('special_requirements', {}),
-            submission_requirements=data.get('submission_requirements', {})
-        )
-
-        console.print(f"[green]✓ Loaded {len(sections)} sections for {self.requirements.agency} {self.requirements.program}[/green]")
+        # Let pydantic parse and validate the nested models straight from the
+        # file bytes; keys the models don't declare are ignored.
+        self.requirements = AgencyRequirements.model_validate_json(requirements_file.read_bytes())
+
+        console.print(f"[green]✓ Loaded {len(self.requirements.sections)} sections for {self.requirements.agency} {self.requirements.program}[/green]")
 
     def get_sections(self) -> Dict[str, SectionRequirements]:
         """Get all section requirements"""
@@ -132,34 +125,43 @@ class AgencyLoader:
 
     def get_ordered_sections(self) -> list[tuple[str, SectionRequirements]]:
         """Get sections in display order"""
-        sections = [(key, section) for key, section in self.requirements.sections.items()]
-        return sorted(sections, key=lambda x: x[1].order)
+        if self._ordered_sections is None:
+            self._ordered_sections = sorted(
+                self.requirements.sections.items(), key=lambda item: item[1].order
+            )
+        return self._ordered_sections
 
     def get_page_limits(self) -> Dict[str, tuple]:
         """Get page limits for quality checker"""
-        limits = {}
-        for key, section in self.requirements.sections.items():
-            limits[key] = (
-                section.min_pages,
-                section.max_pages,
-                section.min_words,
-                section.max_words
-            )
-        return limits
+        if self._page_limits is None:
+            limits = {}
+            for key, section in self.requirements.sections.items():
+                limits[key] = (
+                    section.min_pages,
+                    section.max_pages,
+                    section.min_words,
+                    section.max_words
+                )
+            self._page_limits = limits
+        return self._page_limits
 
     def get_required_keywords(self) -> Dict[str, list[str]]:
         """Get required keywords by section"""
-        keywords = {}
-        for key, section in self.requirements.sections.items():
-            keywords[section.name] = section.required_keywords
-        return keywords
+        if self._required_keywords is None:
+            keywords = {}
+            for key, section in self.requirements.sections.items():
+                keywords[section.name] = section.required_keywords
+            self._required_keywords = keywords
+        return self._required_keywords
 
     def get_section_guidelines(self) -> Dict[str, str]:
         """Get section guidelines for grant agent"""
-        guidelines = {}
-        for key, section in self.requirements.sections.items():
-            guidelines[section.name] = section.guidelines
-        return guidelines
+        if self._section_guidelines is None:
+            self._section_guidelines = {
+                section.name: section.guidelines
+                for section in self.requirements.sections.values()
+            }
+        return self._section_guidelines
 
     def get_evaluation_criteria(self) -> Dict[str, EvaluationCriterion]:
         """Get evaluation criteria"""
@@ -179,39 +181,48 @@ class AgencyLoader:
 
     def generate_requirements_text(self) -> str:
         """Generate formatted requirements text for prompts"""
-        lines = []
-
-        lines.append(f"# {self.requirements.agency} {self.requirements.program} Requirements")
-        lines.append("")
-        lines.append(f"**Funding Amount:** ${self.requirements.funding_amount:,}")
-        lines.append(f"**Duration:** {self.requirements.duration_months} months")
-        lines.append("")
+        # Every GrantAgent embeds this in its system prompts; build it once
+        # per loader.
+        if self._requirements_text is None:
+            self._requirements_text = self._build_requirements_text()
+        return self._requirements_text
+
+    def _build_requirements_text(self) -> str:
+        lines = [
+            f"# {self.requirements.agency} {self.requirements.program} Requirements",
+            "",
+            f"**Funding Amount:** ${self.requirements.funding_amount:,}",
+            f"**Duration:** {self.requirements.duration_months} months",
+            "",
+            # Evaluation criteria
+            "## Evaluation Criteria",
+            "",
+        ]
 
-        # Evaluation criteria
-        lines.append("## Evaluation Criteria")
-        lines.append("")
         for name, criterion in self.requirements.evaluation_criteria.items():
-            lines.append(f"### {name.replace('_', ' ').title()} ({criterion.weight*100:.0f}%)")
-            lines.append(f"{criterion.description}")
-            lines.append("")
-            for sub in criterion.sub_criteria:
-                lines.append(f"- {sub}")
+            lines.extend((
+                f"### {name.replace('_', ' ').title()} ({criterion.weight*100:.0f}%)",
+                f"{criterion.description}",
+                "",
+            ))
+            lines.extend(f"- {sub}" for sub in criterion.sub_criteria)
             lines.append("")
 
         # Format specifications
-        lines.append("## Format Specifications")
-        lines.append("")
         specs = self.requirements.format_specifications
-        lines.append(f"- Font: {specs.font}, {specs.font_size}pt")
-        lines.append(f"- Line spacing: {specs.line_spacing}")
-        lines.append(f"- Margins: {specs.margins['top']}\" (all sides)")
-        lines.append(f"- Approximately {specs.words_per_page} words per page")
-        lines.append("")
+        lines.extend((
+            "## Format Specifications",
+            "",
+            f"- Font: {specs.font}, {specs.font_size}pt",
+            f"- Line spacing: {specs.line_spacing}",
+            f"- Margins: {specs.margins['top']}\" (all sides)",
+            f"- Approximately {specs.words_per_page} words per page",
+            "",
+        ))
 
         # Special requirements
         if self.requirements.special_requirements:
-            lines.append("## Special Requirements")
-            lines.append("")
+            lines.extend(("## Special Requirements", ""))
             for key, value in self.requirements.special_requirements.items():
                 if isinstance(value, bool):
                     status = "Required" if value else "Not required"
@@ -244,10 +255,19 @@ class AgencyLoader:
         console.print("="*70 + "\n")
 
 
+@lru_cache(maxsize=None)
+def _cached_loader(agency: str, templates_dir: str) -> AgencyLoader:
+    return AgencyLoader(agency, templates_dir)
+
+
 def load_agency_requirements(agency: str, templates_dir: str = "agency_templates") -> AgencyLoader:
     """
     Convenience function to load agency requirements
 
+    The requirements files ship with the app and never change at runtime, so
+    each agency is parsed once per process and the loader is shared. Callers
+    must treat the returned loader as read-only.
+
     Args:
         agency: Agency code ('nsf', 'dod', 'nasa')
         templates_dir: Path to agency templates directory
@@ -255,4 +275,4 @@ def load_agency_requirements(agency: str, templates_dir: str = "agency_templates
     Returns:
         AgencyLoader instance with loaded requirements
     """
-    return AgencyLoader(agency, templates_dir)
+    return _cached_loader(agency.lower(), templates_dir)
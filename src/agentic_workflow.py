@@ -1,5 +1,8 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
 from rich.console import Console
 from rich.panel import Panel
+from config import Config
 from src.grant_agent import GrantAgent
 from src.models import GrantSection
 from src.agency_loader import AgencyLoader
@@ -7,12 +10,23 @@ from src.agency_loader import AgencyLoader
 console = Console()
 
 
+def section_executor(total_sections: int) -> ThreadPoolExecutor:
+    """Thread pool for drafting sections concurrently (see submit_sections)."""
+    return ThreadPoolExecutor(
+        max_workers=min(Config.MAX_PARALLEL_SECTIONS, total_sections),
+        thread_name_prefix="section",
+    )
+
+
 class AgenticWorkflow:
     """Orchestrates the generate → critique → refine workflow"""
 
-    def __init__(self, agent: GrantAgent, agency_loader: AgencyLoader):
+    def __init__(self, agent: GrantAgent, agency_loader: AgencyLoader, verbose: Optional[bool] = None):
         self.agent = agent
         self.agency_loader = agency_loader
+        # Per-iteration panels only help someone watching a terminal; when
+        # running headless (the webapp) skip rendering them.
+        self.verbose = console.is_terminal if verbose is None else verbose
     
     def process_section(self, section_name: str, target_length: str, iterations: int = 1) -> GrantSection:
         """
@@ -26,29 +40,32 @@ class AgenticWorkflow:
             target_length: Target length description (e.g., "1-2 pages")
             iterations: Number of critique-refine cycles (default 1)
         """
-        console.print(Panel.fit(
-            f"[bold]Starting Agentic Workflow: {section_name}[/bold]\n"
-            f"Target: {target_length} | Iterations: {iterations}",
-            border_style="blue"
-        ))
+        if self.verbose:
+            console.print(Panel.fit(
+                f"[bold]Starting Agentic Workflow: {section_name}[/bold]\n"
+                f"Target: {target_length} | Iterations: {iterations}",
+                border_style="blue"
+            ))
         
         # Step 1: Generate initial draft
         current_section = self.agent.generate_section(section_name, target_length)
         
         # Step 2-3: Critique and refine (iterate)
         for i in range(iterations):
-            console.print(f"\n[bold magenta]🔄 Iteration {i + 1}/{iterations}[/bold magenta]")
+            if self.verbose:
+                console.print(f"\n[bold magenta]🔄 Iteration {i + 1}/{iterations}[/bold magenta]")
             
             # Generate critique
             critique = self.agent.critique_section(current_section)
             
             # Display critique preview
-            critique_preview = critique[:300] + "..." if len(critique) > 300 else critique
-            console.print(Panel(
-                f"[yellow]{critique_preview}[/yellow]",
-                title="Critique Preview",
-                border_style="yellow"
-            ))
+            if self.verbose:
+                critique_preview = critique[:300] + "..." if len(critique) > 300 else critique
+                console.print(Panel(
+                    f"[yellow]{critique_preview}[/yellow]",
+                    title="Critique Preview",
+                    border_style="yellow"
+                ))
             
             # Refine based on critique
             current_section = self.agent.refine_section(current_section, critique)
@@ -56,6 +73,27 @@ class AgenticWorkflow:
         console.print(f"\n[bold green]✅ {section_name} complete after {iterations} iteration(s)[/bold green]")
         return current_section
     
+    def submit_sections(
+        self,
+        executor: ThreadPoolExecutor,
+        section_specs: list[tuple[str, str, int]],
+        on_start: Optional[Callable[[int], None]] = None,
+    ) -> list[Future]:
+        """Queue process_section for each (name, target_length, iterations) spec.
+
+        on_start(index) runs in the worker thread when a section is actually
+        picked up, not when it is queued. Futures are returned in spec order.
+        """
+        def run(index: int, section_name: str, target_length: str, iterations: int) -> GrantSection:
+            if on_start is not None:
+                on_start(index)
+            return self.process_section(section_name, target_length, iterations)
+
+        return [
+            executor.submit(run, index, section_name, target_length, iterations)
+            for index, (section_name, target_length, iterations) in enumerate(section_specs)
+        ]
+
     def generate_full_proposal(self) -> dict:
         """Generate all sections of the grant proposal based on agency requirements"""
         agency_info = self.agency_loader.requirements
@@ -68,21 +106,30 @@ class AgenticWorkflow:
         sections = {}
 
         # Build section specs from agency requirements
-        section_specs = []
-        for key, section_req in self.agency_loader.get_ordered_sections():
-            if section_req.required:
-                # Format target length
-                if section_req.min_pages == section_req.max_pages:
-                    target_length = f"{section_req.min_pages} pages"
-                else:
-                    target_length = f"{section_req.min_pages}-{section_req.max_pages} pages"
-
-                section_specs.append((section_req.name, target_length, 1))
+        section_specs = [
+            (section_req.name, section_req.target_length, 1)
+            for _key, section_req in self.agency_loader.get_ordered_sections()
+            if section_req.required
+        ]
 
         console.print(f"[yellow]📋 Generating {len(section_specs)} required sections[/yellow]\n")
 
-        for section_name, target_length, iterations in section_specs:
-            sections[section_name] = self.process_section(section_name, target_length, iterations)
+        if Config.PARALLEL_GENERATION and len(section_specs) > 1:
+            # Sections don't depend on each other, and each one spends its time
+            # waiting on Claude — draft them concurrently. Results are collected
+            # in spec order so the returned dict keeps the agency's ordering.
+            executor = section_executor(len(section_specs))
+            try:
+                futures = self.submit_sections(executor, section_specs)
+                for (section_name, _target_length, _iterations), future in zip(section_specs, futures):
+                    sections[section_name] = future.result()
+            finally:
+                # If a section failed, surface it now: drop queued sections
+                # instead of paying for them, and don't wait on the rest.
+                executor.shutdown(wait=False, cancel_futures=True)
+        else:
+            for section_name, target_length, iterations in section_specs:
+                sections[section_name] = self.process_section(section_name, target_length, iterations)
 
         console.print("\n" + "="*70)
         console.print("[bold green]✅ All sections generated successfully![/bold green]")
@@ -1,30 +1,79 @@
 import hashlib
 import hmac
+import logging
 import secrets
 from typing import Optional
-from src.database import get_user_by_username, create_user
+from src.database import get_user_by_username, create_user, update_user_password
+
+log = logging.getLogger("grantentic.auth")
+
+# New hashes are stored as "pbkdf2_sha256$<iterations>$<hex digest>" so the
+# work factor can be raised later without another migration. Rows without
+# the prefix are legacy single-round SHA-256 hashes; they still verify and
+# are upgraded on the user's next successful login.
+_PBKDF2_PREFIX = "pbkdf2_sha256"
+_PBKDF2_ITERATIONS = 600_000
+
+def new_salt() -> str:
+    # 16 random bytes, stored hex-encoded next to the hash.
+    return secrets.token_bytes(16).hex()
 
 def hash_password(password: str, salt: str) -> str:
+    # pbkdf2_hmac runs the whole iteration loop inside OpenSSL.
+    derived = hashlib.pbkdf2_hmac("sha256", password.encode(), salt.encode(), _PBKDF2_ITERATIONS)
+    return f"{_PBKDF2_PREFIX}${_PBKDF2_ITERATIONS}${derived.hex()}"
+
+def _legacy_hash_password(password: str, salt: str) -> str:
     # Order is password + salt to match the hashes produced by the legacy
     # flat-file auth module (see data/users.json prior to the Supabase
     # migration). Changing the order would invalidate every migrated hash.
-    return hashlib.sha256((password + salt).encode()).hexdigest()
+    # Feeding the two parts separately hashes the same bytes without building
+    # the concatenated string first.
+    digest = hashlib.sha256(password.encode())
+    digest.update(salt.encode())
+    return digest.hexdigest()
+
+def _is_legacy_hash(hashed: str) -> bool:
+    return not hashed.startswith(_PBKDF2_PREFIX + "$")
 
 def verify_password(password: str, salt: str, hashed: str) -> bool:
-    return hmac.compare_digest(hash_password(password, salt), hashed)
+    if _is_legacy_hash(hashed):
+        return hmac.compare_digest(_legacy_hash_password(password, salt), hashed)
+    try:
+        _scheme, iterations, expected = hashed.split("$", 2)
+        derived = hashlib.pbkdf2_hmac("sha256", password.encode(), salt.encode(), int(iterations))
+    except ValueError:
+        # Malformed stored hash: treat as a failed login rather than a 500
+        log.warning("verify_password: malformed password hash")
+        return False
+    return hmac.compare_digest(derived.hex(), expected)
 
 def authenticate_user(username: str, password: str) -> Optional[dict]:
     user = get_user_by_username(username)
     if not user:
+        # Burn the same PBKDF2 work as a real check so response time doesn't
+        # reveal which usernames exist.
+        hash_password(password, new_salt())
         return None
     if verify_password(password, user["salt"], user["hashed_password"]):
+        if _is_legacy_hash(user["hashed_password"]):
+            _upgrade_legacy_hash(user, password)
         return user
     return None
 
+def _upgrade_legacy_hash(user: dict, password: str) -> None:
+    """Re-hash a legacy SHA-256 password with PBKDF2 now that we have the
+    plaintext. Best effort — a failed upgrade must not block the login."""
+    salt = new_salt()
+    try:
+        update_user_password(str(user["id"]), hash_password(password, salt), salt)
+    except Exception as exc:
+        log.warning("auth: legacy hash upgrade failed for user_id=%s: %s", user.get("id"), exc)
+
 def register_user(username: str, password: str, email: str = "", is_admin: bool = False) -> dict:
     existing = get_user_by_username(username)
     if existing:
         raise ValueError(f"Username '{username}' is already taken.")
-    salt = secrets.token_hex(16)
+    salt = new_salt()
     hashed = hash_password(password, salt)
     return create_user(username, hashed, salt, is_admin, email=email)
@@ -1,3 +1,4 @@
+import threading
 import tiktoken
 from typing import List
 from datetime import datetime
@@ -11,24 +12,41 @@ console = Console()
 class CostTracker:
     """Track and report API usage costs"""
     
+    # model -> (input, output) USD per token
     PRICING = {
-        "claude-sonnet-4-5": {
-            "input": 3.00 / 1_000_000,   # $3 per million input tokens
-            "output": 15.00 / 1_000_000   # $15 per million output tokens
-        },
-        "claude-opus-4-1": {
-            "input": 15.00 / 1_000_000,
-            "output": 75.00 / 1_000_000
-        },
-        "claude-haiku-4-5": {
-            "input": 0.80 / 1_000_000,
-            "output": 4.00 / 1_000_000
-        }
+        "claude-sonnet-4-5": (3.00 / 1_000_000, 15.00 / 1_000_000),  # $3 / $15 per million tokens
+        "claude-opus-4-1": (15.00 / 1_000_000, 75.00 / 1_000_000),
+        "claude-haiku-4-5": (0.80 / 1_000_000, 4.00 / 1_000_000),
     }
     
+    # Prompt-cache tokens are billed relative to the model's input rate
+    CACHE_READ_MULTIPLIER = 0.10
+    CACHE_WRITE_MULTIPLIER = 1.25
+    
     def __init__(self):
         self.metrics: List[CostMetrics] = []
-        self.encoding = tiktoken.get_encoding("cl100k_base")
+        self._encoding = None
+        # Running totals so the per-section progress updates don't re-sum
+        # every metric. Parallel section generation records from worker
+        # threads, hence the lock.
+        self._lock = threading.Lock()
+        self._total_input = 0
+        self._total_output = 0
+        self._total_cost = 0.0
+        self._cache_read_tokens = 0
+        self._cache_write_tokens = 0
+        self._cache_cost = 0.0
+    
+    @property
+    def encoding(self):
+        """cl100k_base encoding, loaded on first use.
+
+        Usage is normally recorded from API-reported counts, so most trackers
+        never need the BPE tables at all.
+        """
+        if self._encoding is None:
+            self._encoding = tiktoken.get_encoding("cl100k_base")
+        return self._encoding
     
     def estimate_tokens(self, text: str) -> int:
         """Estimate token count for text"""
@@ -43,12 +61,9 @@ class CostTracker:
         model: str = "claude-sonnet-4-5"
     ):
         """Record API usage and calculate cost"""
-        pricing = self.PRICING.get(model, self.PRICING["claude-sonnet-4-5"])
+        input_rate, output_rate = self.PRICING.get(model, self.PRICING["claude-sonnet-4-5"])
         
-        cost = (
-            input_tokens * pricing["input"] +
-            output_tokens * pricing["output"]
-        )
+        cost = input_tokens * input_rate + output_tokens * output_rate
         
         metric = CostMetrics(
             section_name=section_name,
@@ -59,18 +74,54 @@ class CostTracker:
             model=model
         )
         
-        self.metrics.append(metric)
+        with self._lock:
+            self.metrics.append(metric)
+            self._total_input += input_tokens
+            self._total_output += output_tokens
+            self._total_cost += cost
+        return cost
+    
+    def record_cache_usage(
+        self,
+        cache_read_tokens: int,
+        cache_write_tokens: int,
+        model: str = "claude-sonnet-4-5"
+    ):
+        """Record prompt-cache reads/writes reported alongside a call.
+
+        Anthropic reports these separately from input_tokens, so they are
+        added to the totals on top of whatever record_usage logged.
+        """
+        input_rate, _ = self.PRICING.get(model, self.PRICING["claude-sonnet-4-5"])
+        cost = input_rate * (
+            cache_read_tokens * self.CACHE_READ_MULTIPLIER +
+            cache_write_tokens * self.CACHE_WRITE_MULTIPLIER
+        )
+        with self._lock:
+            self._cache_read_tokens += cache_read_tokens
+            self._cache_write_tokens += cache_write_tokens
+            self._cache_cost += cost
+            self._total_cost += cost
         return cost
     
     def get_total_cost(self) -> float:
         """Calculate total cost across all operations"""
-        return sum(m.cost_usd for m in self.metrics)
+        return self._total_cost
     
     def get_total_tokens(self) -> tuple[int, int]:
         """Get total input and output tokens"""
-        total_input = sum(m.input_tokens for m in self.metrics)
-        total_output = sum(m.output_tokens for m in self.metrics)
-        return total_input, total_output
+        return self._total_input, self._total_output
+    
+    def get_cache_tokens(self) -> tuple[int, int]:
+        """Get total prompt-cache read and write tokens"""
+        return self._cache_read_tokens, self._cache_write_tokens
+    
+    def get_cache_hit_rate(self) -> float:
+        """Share of all prompt tokens that were served from the prompt cache"""
+        prompt_tokens = self._total_input + self._cache_read_tokens + self._cache_write_tokens
+        if not prompt_tokens:
+            return 0.0
+        return self._cache_read_tokens / prompt_tokens
     
     def print_summary(self):
         """Print cost summary table"""
@@ -93,8 +144,24 @@ class CostTracker:
         
         total_in, total_out = self.get_total_tokens()
         total_cost = self.get_total_cost()
+        cache_read, cache_write = self.get_cache_tokens()
         
         table.add_section()
+        if cache_read or cache_write:
+            # Cache tokens are billed apart from the per-call input above, so
+            # they get their own cost line; the token split and hit rate go in
+            # the caption rather than the Input Tokens column.
+            table.add_row(
+                "Prompt cache",
+                "cache read/write",
+                "",
+                "",
+                f"${self._cache_cost:.4f}"
+            )
+            table.caption = (
+                f"Prompt cache: {cache_read:,} tokens read, {cache_write:,} written "
+                f"({self.get_cache_hit_rate():.0%} of prompt tokens from cache)"
+            )
         table.add_row(
             "[bold]TOTAL[/bold]",
             "",
@@ -1,6 +1,7 @@
 import os
 import logging
 import secrets
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
 from supabase import create_client, Client
 from typing import Optional
@@ -8,6 +9,14 @@ import json
 
 log = logging.getLogger("grantentic.database")
 
+@lru_cache(maxsize=1)
+def _client_for(url: str, key: str) -> Client:
+    # create_client builds a fresh HTTP session (connection pool, auth headers)
+    # each time; every page render makes several queries, so build it once
+    # per process and reuse it. Keyed on the credentials so a rotated key in
+    # the environment still yields a new client.
+    return create_client(url, key)
+
 def get_supabase() -> Client:
     """
     Return a Supabase client authenticated with the service_role key.
@@ -24,7 +33,7 @@ def get_supabase() -> Client:
         raise RuntimeError(
             "SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY must be set in environment"
         )
-    return create_client(url, key)
+    return _client_for(url, key)
 
 def get_user_by_username(username: str) -> Optional[dict]:
     sb = get_supabase()
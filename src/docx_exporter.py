@@ -2,22 +2,52 @@ from docx import Document
 from docx.shared import Pt, Inches, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from datetime import datetime
+from io import BytesIO
 from pathlib import Path
 from rich.console import Console
 from src.models import GrantProposal
 
 console = Console()
 
+# Company names are free text; map whitespace and path/reserved characters to
+# underscores in one pass so the name is safe as a filename.
+_FILENAME_UNSAFE = str.maketrans({c: '_' for c in ' \t/\\:*?"<>|'})
+
 
 class DocxExporter:
     """Export grant proposals to Word documents"""
     
     def __init__(self):
         self.output_dir = Path("outputs")
-        self.output_dir.mkdir(exist_ok=True)
     
     def create_document(self, proposal: GrantProposal) -> str:
-        """Create a formatted Word document from grant proposal"""
+        """Create a formatted Word document from grant proposal and save it
+        under outputs/. Returns the file path."""
+        doc = self._build_document(proposal)
+        # Only the save-to-disk path needs outputs/; the webapp renders in memory.
+        self.output_dir.mkdir(exist_ok=True)
+        filepath = self.output_dir / self.document_filename(proposal)
+
+        doc.save(str(filepath))
+
+        console.print(f"[green]✓ Document saved to: {filepath}[/green]")
+        console.print(f"[cyan]📊 Total words: {proposal.total_word_count:,}[/cyan]")
+
+        return str(filepath)
+
+    def create_document_bytes(self, proposal: GrantProposal) -> bytes:
+        """Render the Word document into memory, for serving it straight
+        back to the browser without a round trip through disk."""
+        buffer = BytesIO()
+        self._build_document(proposal).save(buffer)
+        return buffer.getvalue()
+
+    @staticmethod
+    def document_filename(proposal: GrantProposal) -> str:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return f"{proposal.company_name.translate(_FILENAME_UNSAFE)}_NSF_SBIR_Phase1_{timestamp}.docx"
+
+    def _build_document(self, proposal: GrantProposal):
         console.print("\n[bold blue]📄 Creating Word document...[/bold blue]")
         
         doc = Document()
@@ -79,15 +109,5 @@ class DocxExporter:
         footer_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
         footer_para.runs[0].font.size = Pt(8)
         footer_para.runs[0].font.color.rgb = RGBColor(128, 128, 128)
-        
-        # Save document
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{proposal.company_name.replace(' ', '_')}_NSF_SBIR_Phase1_{timestamp}.docx"
-        filepath = self.output_dir / filename
-        
-        doc.save(str(filepath))
-        
-        console.print(f"[green]✓ Document saved to: {filepath}[/green]")
-        console.print(f"[cyan]📊 Total words: {proposal.total_word_count:,}[/cyan]")
-        
-        return str(filepath)
+
+        return doc
@@ -3,6 +3,9 @@ import json
 import logging
 import os
 import re
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Dict, List, Optional
 from rich.console import Console
@@ -15,6 +18,33 @@ from config import Config
 console = Console()
 log = logging.getLogger("grantentic.grant_agent")
 
+_LEGACY_COMPANY_CONTEXT_PATH = Path(__file__).resolve().parent.parent / "data" / "company_context.json"
+
+
+@lru_cache(maxsize=1)
+def _read_legacy_company_context(mtime: float) -> dict:
+    """Parse the legacy company_context.json once per on-disk version.
+
+    Keyed on the file's mtime so an edited file is picked up on the next
+    GrantAgent without re-parsing it for every agent in between.
+    """
+    return json.loads(_LEGACY_COMPANY_CONTEXT_PATH.read_bytes())
+
+
+@contextmanager
+def _spinner(description: str):
+    """Rich spinner around a blocking call, on an interactive main thread only.
+
+    rich 13.x allows a single live display at a time and raises LiveError
+    otherwise, so parallel section workers (and headless servers) skip it.
+    """
+    if not console.is_terminal or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+    with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}")) as progress:
+        progress.add_task(description, total=None)
+        yield
+
 
 # ── Fabrication detectors (used by _validate_no_fabrication) ──
 
@@ -737,6 +767,17 @@ Your revision must demonstrate scientific rigor worthy of NASA's expert review p
     }
 }
 
+# Each expert prompt split once around its {agency_requirements} placeholder,
+# so building a system prompt is a concatenation instead of a str.format scan
+# over a multi-KB template.
+_EXPERT_PROMPT_PARTS = {
+    agency: {
+        prompt_type: prompt.partition("{agency_requirements}")
+        for prompt_type, prompt in prompts.items()
+    }
+    for agency, prompts in EXPERT_SYSTEM_PROMPTS.items()
+}
+
 # Section-specific guidance for each section type
 SECTION_EXPERT_GUIDANCE = {
     # =========================================================================
@@ -930,6 +971,30 @@ Reviewers want to know you can actually do the work.
 '''
 }
 
+# Multi-agency section names -> SECTION_EXPERT_GUIDANCE key, for names that
+# don't match a guidance entry exactly.
+_SECTION_GUIDANCE_ALIASES = {
+    "Technical Abstract": "Technology Innovation",
+    "Phase I Technical Objectives": "Technical Objectives and Challenges",
+    "Innovation and Technical Approach": "Technical Objectives and Challenges",
+    "Broader Impacts": "Broader Impacts",
+    "Anticipated Benefits": "Broader Impacts",
+    "Commercialization Plan": "Commercialization Plan",
+    "Commercialization Strategy": "Commercialization Plan",
+    "Dual Use and Commercialization": "Commercialization Plan",
+    "Budget and Budget Justification": "Budget and Budget Justification",
+    "Budget Narrative and Justification": "Budget and Budget Justification",
+    "Cost Proposal and Budget Justification": "Budget and Budget Justification",
+    "Work Plan and Timeline": "Work Plan and Timeline",
+    "Work Plan": "Work Plan and Timeline",
+    "Key Personnel Biographical Sketches": "Key Personnel Biographical Sketches",
+    "Key Personnel": "Key Personnel Biographical Sketches",
+    "Key Personnel and Qualifications": "Key Personnel Biographical Sketches",
+    "Facilities, Equipment, and Other Resources": "Facilities, Equipment, and Other Resources",
+    "Facilities and Equipment": "Facilities, Equipment, and Other Resources",
+    "Company Capabilities and Experience": "Facilities, Equipment, and Other Resources",
+}
+
 
 class GrantAgent:
     """AI agent for generating grant proposal sections using expert-level prompts"""
@@ -959,17 +1024,20 @@ class GrantAgent:
         if company_context is not None:
             self.company_context = CompanyContext(**company_context)
         else:
-            company_context_path = os.path.join(
-                os.path.dirname(os.path.dirname(__file__)),
-                "data",
-                "company_context.json",
-            )
-            if os.path.exists(company_context_path):
-                with open(company_context_path, "r") as f:
-                    data = json.load(f)
-                    self.company_context = CompanyContext(**data)
-            else:
+            try:
+                stat = os.stat(_LEGACY_COMPANY_CONTEXT_PATH)
+            except OSError:
+                stat = None
+            # An empty placeholder file means "no context", same as missing;
+            # don't hand it to the JSON parser.
+            if stat is None or stat.st_size == 0:
                 self.company_context = CompanyContext()
+            else:
+                self.company_context = CompanyContext(**_read_legacy_company_context(stat.st_mtime))
+
+        # The context is fixed for the agent's lifetime; serialize it once
+        # rather than on every generate_section call.
+        self._company_json = self.company_context.model_dump_json(indent=2)
 
         # Generate agency-specific requirements text
         self.agency_requirements = self.agency_loader.generate_requirements_text()
@@ -980,11 +1048,19 @@ class GrantAgent:
         # Get agency name for prompt selection
         self.agency_name = self.agency_loader.requirements.agency
 
+        # Formatted system prompts by prompt type. The requirements text never
+        # changes for an agent, so each prompt is only formatted once.
+        self._system_prompts: Dict[str, str] = {}
+
     def _get_expert_system_prompt(self, prompt_type: str) -> str:
         """Get the expert system prompt for the current agency and prompt type"""
-        agency_prompts = EXPERT_SYSTEM_PROMPTS.get(self.agency_name, EXPERT_SYSTEM_PROMPTS["NSF"])
-        base_prompt = agency_prompts.get(prompt_type, "")
-        return base_prompt.format(agency_requirements=self.agency_requirements)
+        prompt = self._system_prompts.get(prompt_type)
+        if prompt is None:
+            agency_parts = _EXPERT_PROMPT_PARTS.get(self.agency_name, _EXPERT_PROMPT_PARTS["NSF"])
+            prefix, placeholder, suffix = agency_parts.get(prompt_type, ("", "", ""))
+            prompt = prefix + self.agency_requirements + suffix if placeholder else prefix
+            self._system_prompts[prompt_type] = prompt
+        return prompt
 
     def _get_section_guidance(self, section_name: str) -> str:
         """Get expert guidance for a specific section type"""
@@ -993,29 +1069,7 @@ class GrantAgent:
             return SECTION_EXPERT_GUIDANCE[section_name]
 
         # Fall back to fuzzy mapping for multi-agency section names
-        section_mapping = {
-            "Technical Abstract": "Technology Innovation",
-            "Phase I Technical Objectives": "Technical Objectives and Challenges",
-            "Innovation and Technical Approach": "Technical Objectives and Challenges",
-            "Broader Impacts": "Broader Impacts",
-            "Anticipated Benefits": "Broader Impacts",
-            "Commercialization Plan": "Commercialization Plan",
-            "Commercialization Strategy": "Commercialization Plan",
-            "Dual Use and Commercialization": "Commercialization Plan",
-            "Budget and Budget Justification": "Budget and Budget Justification",
-            "Budget Narrative and Justification": "Budget and Budget Justification",
-            "Cost Proposal and Budget Justification": "Budget and Budget Justification",
-            "Work Plan and Timeline": "Work Plan and Timeline",
-            "Work Plan": "Work Plan and Timeline",
-            "Key Personnel Biographical Sketches": "Key Personnel Biographical Sketches",
-            "Key Personnel": "Key Personnel Biographical Sketches",
-            "Key Personnel and Qualifications": "Key Personnel Biographical Sketches",
-            "Facilities, Equipment, and Other Resources": "Facilities, Equipment, and Other Resources",
-            "Facilities and Equipment": "Facilities, Equipment, and Other Resources",
-            "Company Capabilities and Experience": "Facilities, Equipment, and Other Resources",
-        }
-
-        guidance_key = section_mapping.get(section_name)
+        guidance_key = _SECTION_GUIDANCE_ALIASES.get(section_name)
         if guidance_key:
             return SECTION_EXPERT_GUIDANCE.get(guidance_key, "")
         return ""
@@ -1302,19 +1356,61 @@ class GrantAgent:
         warning_lines.extend(["", "---", ""])
         return "\n".join(warning_lines) + content
 
-    def _call_claude(self, system_prompt: str, user_prompt: str, max_tokens: int = 4000) -> tuple[str, int, int]:
-        """Call Claude API and track usage"""
+    def _call_claude(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int = 4000,
+        context: Optional[str] = None,
+    ) -> tuple[str, int, int]:
+        """Call Claude API and track usage.
+
+        ``context`` is run-constant material (e.g. the company JSON) sent as a
+        cacheable block ahead of the per-call user prompt.
+        """
+        # The system prompt is identical for every call of a given type
+        # (expert prompt + agency requirements), so mark it cacheable: repeat
+        # calls within the cache window bill it at the cache-read rate.
+        # Anything that varies per call must come after the cached blocks,
+        # since the cache matches on exact prefix.
+        if context:
+            user_content = [
+                {"type": "text", "text": context, "cache_control": {"type": "ephemeral"}},
+                {"type": "text", "text": user_prompt},
+            ]
+        else:
+            user_content = user_prompt
         response = self.client.messages.create(
             model=self.model,
             max_tokens=max_tokens,
-            system=system_prompt,
-            messages=[{"role": "user", "content": user_prompt}]
+            system=[{
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"},
+            }],
+            messages=[{"role": "user", "content": user_content}]
         )
 
         content_block = response.content[0]
         content = content_block.text if hasattr(content_block, 'text') else str(content_block)
-        input_tokens = response.usage.input_tokens
-        output_tokens = response.usage.output_tokens
+        usage = response.usage
+        input_tokens = usage.input_tokens
+        output_tokens = usage.output_tokens
+
+        cache_read = getattr(usage, "cache_read_input_tokens", None) or 0
+        cache_write = getattr(usage, "cache_creation_input_tokens", None) or 0
+        if cache_read or cache_write:
+            self.cost_tracker.record_cache_usage(cache_read, cache_write, self.model)
+
+        # Per-call cache telemetry, for checking that the cached prefixes
+        # actually hit (share of prompt tokens served from cache).
+        prompt_tokens = input_tokens + cache_read + cache_write
+        log.info(
+            "claude_usage: agency=%s input=%d cache_read=%d cache_write=%d "
+            "output=%d cache_hit=%.0f%%",
+            self.agency_name, input_tokens, cache_read, cache_write, output_tokens,
+            100.0 * cache_read / prompt_tokens if prompt_tokens else 0.0,
+        )
 
         return content, input_tokens, output_tokens
 
@@ -1335,7 +1431,8 @@ class GrantAgent:
         # Get section-specific expert guidance
         section_guidance = self._get_section_guidance(section_name)
 
-        company_json = self.company_context.model_dump_json(indent=2)
+        # Same for every section of the run, so it goes first as a cached block
+        company_block = f"## COMPANY INFORMATION\n{self._company_json}"
 
         # Build length constraint
         if char_limit > 0:
@@ -1362,7 +1459,7 @@ class GrantAgent:
 ## CRITICAL RULES
 - Do NOT fabricate technical claims, performance numbers, hypotheses, or test results
 - Do NOT invent team credentials, publications, or prior grants
-- Use ONLY information from the company context provided below
+- Use ONLY information from the company information provided above
 - If data is missing, state what exists rather than inventing what doesn't
 
 ## SECTION-SPECIFIC EXPERT GUIDANCE
@@ -1371,9 +1468,6 @@ class GrantAgent:
 ## AGENCY GUIDELINES FOR THIS SECTION
 {self.section_guidelines.get(section_name, "")}
 
-## COMPANY INFORMATION
-{company_json}
-
 ## YOUR TASK
 Write this section to score "Excellent" by:
 1. Opening with the most compelling point — reviewers decide quickly
@@ -1384,9 +1478,10 @@ Write this section to score "Excellent" by:
 
 Generate the complete {section_name} section now. Write in a professional, compelling style. Output ONLY the section text — no headers, labels, or meta-commentary:"""
 
-        with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}")) as progress:
-            task = progress.add_task(f"Calling Claude for {section_name}...", total=None)
-            content, input_tokens, output_tokens = self._call_claude(system_prompt, user_prompt, max_tokens=Config.MAX_TOKENS_GENERATE)
+        with _spinner(f"Calling Claude for {section_name}..."):
+            content, input_tokens, output_tokens = self._call_claude(
+                system_prompt, user_prompt, max_tokens=Config.MAX_TOKENS_GENERATE, context=company_block
+            )
 
         # Track cost
         self.cost_tracker.record_usage(section_name, "generate", input_tokens, output_tokens, self.model)
@@ -1398,7 +1493,8 @@ Generate the complete {section_name} section now. Write in a professional, compe
                 f"{user_prompt}\n\n## FABRICATION CONSTRAINT (RETRY)\n{extra_instruction}"
             )
             retry_content, in_t, out_t = self._call_claude(
-                system_prompt, retry_prompt, max_tokens=Config.MAX_TOKENS_GENERATE
+                system_prompt, retry_prompt, max_tokens=Config.MAX_TOKENS_GENERATE,
+                context=company_block,
             )
             self.cost_tracker.record_usage(
                 section_name, "generate_retry", in_t, out_t, self.model
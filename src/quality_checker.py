@@ -688,9 +688,12 @@ class QualityChecker:
             if 0 <= idx < len(proposal.sections):
                 proposal.sections[idx] = trimmed_section
 
+        suggestions_count = len(self.suggestions)
         return {
             "report": report_text,
             "trimmed_sections": list(trimmed_sections.keys()),
-            "suggestions_count": len(self.suggestions),
-            "overall_passed": len(self.suggestions) == 0
+            "suggestions_count": suggestions_count,
+            # Each open suggestion costs 5 points, floored at 0.
+            "quality_score": max(0, 100 - suggestions_count * 5),
+            "overall_passed": suggestions_count == 0
         }
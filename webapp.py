@@ -12,8 +12,8 @@ import os
 import re
 import secrets
 import time
+import threading
 import asyncio
-from pathlib import Path
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any
 from contextlib import asynccontextmanager
@@ -36,7 +36,7 @@ if _sentry_dsn:
     log.info("Sentry initialized")
 
 from fastapi import FastAPI, Request, Form, Depends, HTTPException, Response, UploadFile, File
-from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, StreamingResponse, FileResponse
+from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from starlette.middleware.sessions import SessionMiddleware
@@ -44,10 +44,9 @@ from starlette.middleware.sessions import SessionMiddleware
 import base64
 import requests
 import urllib.parse
-import stripe
 
 from config import Config
-from src.auth import authenticate_user, register_user
+from src.auth import authenticate_user, register_user, hash_password, new_salt
 from src.database import (
     get_user_by_username,
     get_user_by_email,
@@ -78,13 +77,9 @@ from src.database import (
     update_proposal_sections_admin,
     update_proposal_status_admin,
 )
-from src.auth import hash_password
 from src.agency_loader import load_agency_requirements
 from src.models import GrantProposal, GrantSection
 
-# Initialize Stripe
-stripe.api_key = Config.STRIPE_SECRET_KEY
-
 
 # Application state
 class AppState:
@@ -95,9 +90,26 @@ class AppState:
 app_state = AppState()
 
 
+def _prewarm_generation_imports() -> None:
+    """Import the generation stack so the first /generate/stream doesn't pay
+    for anthropic, tiktoken, python-docx and the prompt modules."""
+    try:
+        import src.cost_tracker  # noqa: F401
+        import src.grant_agent  # noqa: F401
+        import src.agentic_workflow  # noqa: F401
+        import src.quality_checker  # noqa: F401
+        import src.docx_exporter  # noqa: F401
+    except Exception:
+        # generate_stream imports these again and reports any failure there.
+        log.exception("prewarm: generation imports failed")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan - initialize on startup"""
+    # Warm the heavy imports in the background so startup (and /health)
+    # isn't held up by them.
+    threading.Thread(target=_prewarm_generation_imports, name="prewarm", daemon=True).start()
     yield
 
 
@@ -234,13 +246,26 @@ async def login_page(request: Request, error: str = None, success: str = None):
     })
 
 
+def _start_session(request: Request, user: dict) -> None:
+    """Populate the session for an authenticated user row in one update."""
+    is_admin = user.get("is_admin", False)
+    request.session.update({
+        "username": user["username"],
+        "user_id": str(user["id"]),
+        "is_admin": is_admin,
+        "user": {"username": user["username"], "role": "admin" if is_admin else "user"},
+    })
+
+
 @app.post("/login")
 async def login(request: Request):
     """Handle login"""
     form = await request.form()
     username = form.get("username", "").strip()
     password = form.get("password", "")
-    user = authenticate_user(username, password)
+    # Password verification is deliberately slow (PBKDF2); keep it off the
+    # event loop.
+    user = await asyncio.to_thread(authenticate_user, username, password)
     if not user:
         log.info("login: auth FAILED for username=%r", username)
         return templates.TemplateResponse(request, "login.html", {
@@ -251,10 +276,7 @@ async def login(request: Request):
         user["username"], user.get("id"), type(user.get("id")).__name__,
         user.get("is_admin"),
     )
-    request.session["username"] = user["username"]
-    request.session["user_id"] = str(user["id"])
-    request.session["is_admin"] = user.get("is_admin", False)
-    request.session["user"] = {"username": user["username"], "role": "admin" if user.get("is_admin") else "user"}
+    _start_session(request, user)
     return RedirectResponse(url="/dashboard", status_code=303)
 
 
@@ -336,7 +358,7 @@ async def auth_google_callback(
         username = base_username
         for _ in range(5):
             try:
-                user = register_user(username, secrets.token_urlsafe(32), email=email)
+                user = await asyncio.to_thread(register_user, username, secrets.token_urlsafe(32), email=email)
                 break
             except ValueError:
                 username = base_username + "_" + secrets.token_hex(3)
@@ -345,10 +367,7 @@ async def auth_google_callback(
             return RedirectResponse(url="/login?error=Could+not+create+account.+Please+contact+support.", status_code=302)
 
     log.info("auth_google_callback: login OK email=%r user_id=%r", email, user.get("id"))
-    request.session["username"] = user["username"]
-    request.session["user_id"] = str(user["id"])
-    request.session["is_admin"] = user.get("is_admin", False)
-    request.session["user"] = {"username": user["username"], "role": "admin" if user.get("is_admin") else "user"}
+    _start_session(request, user)
     return RedirectResponse(url="/dashboard", status_code=303)
 
 
@@ -389,7 +408,7 @@ async def register(request: Request):
         })
 
     try:
-        register_user(username, password, email=email)
+        await asyncio.to_thread(register_user, username, password, email=email)
     except ValueError as exc:
         return templates.TemplateResponse(request, "register.html", {
             "error": str(exc), "username": username, "email": email
@@ -504,9 +523,8 @@ async def reset_password(request: Request):
         })
 
     # Update the password
-    import secrets as _secrets
-    salt = _secrets.token_hex(16)
-    hashed = hash_password(password, salt)
+    salt = new_salt()
+    hashed = await asyncio.to_thread(hash_password, password, salt)
     update_user_password(str(reset["user_id"]), hashed, salt)
     mark_token_used(token)
 
@@ -561,7 +579,7 @@ async def create_profile(
 
     # Create the user account
     try:
-        user = register_user(username, password)
+        user = await asyncio.to_thread(register_user, username, password)
     except Exception:
         return RedirectResponse(
             url="/create-profile?error=Error+creating+account",
@@ -624,15 +642,21 @@ async def dashboard(request: Request, agency: str = "nsf"):
         return RedirectResponse(url="/login", status_code=302)
 
     user_id = request.session.get("user_id")
-    company_data = get_company_context(user_id) if user_id else {}
+    if user_id:
+        # Independent Supabase round-trips — run them side by side, off the
+        # event loop, rather than back to back.
+        company_data, credits = await asyncio.gather(
+            asyncio.to_thread(get_company_context, user_id),
+            asyncio.to_thread(get_credits, user_id),
+        )
+    else:
+        company_data, credits = {}, {"pre_proposal_credits": 0, "full_proposal_credits": 0}
     company_data = company_data or {}
     agency_info = get_agency_info(agency)
 
     # Get proposal if exists
     proposal = app_state.proposals.get(user['username'])
 
-    credits = get_credits(user_id) if user_id else {"pre_proposal_credits": 0, "full_proposal_credits": 0}
-
     return templates.TemplateResponse(request, "dashboard.html", {
         "user": user,
         "company_data": company_data,
@@ -779,6 +803,11 @@ async def generate_page(request: Request, agency: str = "nsf"):
     })
 
 
+def _sse(payload: dict) -> str:
+    """Frame one payload as a server-sent event."""
+    return f"data: {json.dumps(payload)}\n\n"
+
+
 @app.get("/generate/stream")
 async def generate_stream(request: Request, agency: str = "nsf"):
     """SSE endpoint for proposal generation with real-time updates"""
@@ -811,18 +840,19 @@ async def generate_stream(request: Request, agency: str = "nsf"):
             # Import heavy modules only when needed
             from src.cost_tracker import CostTracker
             from src.grant_agent import GrantAgent
-            from src.agentic_workflow import AgenticWorkflow
+            from src.agentic_workflow import AgenticWorkflow, section_executor
             from src.quality_checker import QualityChecker
             from src.docx_exporter import DocxExporter
 
             start_time = time.time()
 
-            yield f"data: {json.dumps({'type': 'status', 'message': 'Initializing system...'})}\n\n"
+            yield _sse({'type': 'status', 'message': 'Initializing system...'})
 
             # Load agency requirements
             agency_loader = load_agency_requirements(agency)
+            requirements = agency_loader.requirements
 
-            yield f"data: {json.dumps({'type': 'status', 'message': f'Loaded {agency_loader.requirements.agency} requirements'})}\n\n"
+            yield _sse({'type': 'status', 'message': f'Loaded {requirements.agency} requirements'})
 
             # Initialize components — load this user's intake from Supabase so
             # the generation prompt sees the 13-field deep-tech form data.
@@ -833,81 +863,127 @@ async def generate_stream(request: Request, agency: str = "nsf"):
             workflow = AgenticWorkflow(agent, agency_loader)
             quality_checker = QualityChecker(agency_loader)
             exporter = DocxExporter()
+            company_context = agent.company_context
 
-            yield f"data: {json.dumps({'type': 'status', 'message': f'Company: {agent.company_context.company_name}'})}\n\n"
+            yield _sse({'type': 'status', 'message': f'Company: {company_context.company_name}'})
 
             # Get sections to generate
-            ordered_sections = agency_loader.get_ordered_sections()
-            required_sections = [(k, s) for k, s in ordered_sections if s.required]
-            total_sections = len(required_sections)
-
-            yield f"data: {json.dumps({'type': 'init', 'total_sections': total_sections})}\n\n"
-
-            # Generate sections
+            jobs = [
+                (section_req, section_req.target_length)
+                for _key, section_req in agency_loader.get_ordered_sections()
+                if section_req.required
+            ]
+            total_sections = len(jobs)
+
+            yield _sse({'type': 'init', 'total_sections': total_sections})
+
+            # Generate sections. process_section blocks on Claude calls for
+            # minutes at a time, so it always runs in a worker thread to keep
+            # the event loop serving other requests.
             sections = {}
-            section_count = 0
-
-            for key, section_req in required_sections:
-                section_count += 1
-                progress = int((section_count / total_sections) * 100)
 
-                # Format target length — use character limit if defined
-                if section_req.max_chars > 0:
-                    target_length = f"{section_req.max_chars:,} characters"
-                elif section_req.min_pages == section_req.max_pages:
-                    target_length = f"{section_req.min_pages} pages"
-                else:
-                    target_length = f"{section_req.min_pages}-{section_req.max_pages} pages"
+            if Config.PARALLEL_GENERATION and total_sections > 1:
+                # Sections are independent until the NSF cross-check below,
+                # so they can be drafted concurrently. Workers report through
+                # an event queue: section_start when a worker actually picks
+                # a section up (not when it is queued), section_complete in
+                # completion order.
+                loop = asyncio.get_running_loop()
+                events = asyncio.Queue()
+
+                def notify(*event):
+                    try:
+                        loop.call_soon_threadsafe(events.put_nowait, event)
+                    except RuntimeError:
+                        pass  # stream abandoned and loop closed; nobody to tell
+
+                executor = section_executor(total_sections)
+                try:
+                    futures = workflow.submit_sections(
+                        executor,
+                        [(section_req.name, target_length, iterations) for section_req, target_length in jobs],
+                        on_start=lambda index: notify('start', index),
+                    )
+                    for index, future in enumerate(futures):
+                        future.add_done_callback(lambda f, index=index: notify('done', index, f))
+
+                    started = completed = 0
+                    while completed < total_sections:
+                        kind, index, *rest = await events.get()
+                        section_req, target_length = jobs[index]
+                        progress = int((completed / total_sections) * 100)
+                        if kind == 'start':
+                            started += 1
+                            yield _sse({'type': 'section_start', 'section': section_req.name, 'number': started, 'total': total_sections, 'progress': progress, 'target': target_length})
+                            continue
+                        section = rest[0].result()
+                        sections[section_req.name] = section
+                        completed += 1
+                        progress = int((completed / total_sections) * 100)
+                        current_cost = cost_tracker.get_total_cost()
+                        yield _sse({'type': 'section_complete', 'section': section_req.name, 'word_count': section.word_count, 'cost': f'${current_cost:.2f}', 'progress': progress})
+                finally:
+                    # Don't block the event loop on stragglers if a section failed.
+                    executor.shutdown(wait=False, cancel_futures=True)
+                # Restore agency order for everything downstream.
+                sections = {section_req.name: sections[section_req.name] for section_req, _ in jobs}
+            else:
+                for section_count, (section_req, target_length) in enumerate(jobs, 1):
+                    progress = int((section_count / total_sections) * 100)
 
-                yield f"data: {json.dumps({'type': 'section_start', 'section': section_req.name, 'number': section_count, 'total': total_sections, 'progress': progress, 'target': target_length})}\n\n"
+                    yield _sse({'type': 'section_start', 'section': section_req.name, 'number': section_count, 'total': total_sections, 'progress': progress, 'target': target_length})
 
-                # Generate section (this is blocking, but we yield updates)
-                section = workflow.process_section(section_req.name, target_length, iterations)
-                sections[section_req.name] = section
+                    section = await asyncio.to_thread(
+                        workflow.process_section, section_req.name, target_length, iterations,
+                    )
+                    sections[section_req.name] = section
 
-                current_cost = cost_tracker.get_total_cost()
+                    current_cost = cost_tracker.get_total_cost()
 
-                yield f"data: {json.dumps({'type': 'section_complete', 'section': section_req.name, 'word_count': section.word_count, 'cost': f'${current_cost:.2f}', 'progress': progress})}\n\n"
+                    yield _sse({'type': 'section_complete', 'section': section_req.name, 'word_count': section.word_count, 'cost': f'${current_cost:.2f}', 'progress': progress})
 
             # NSF only: run the seven-criteria post-generation checker.
             # Read-only — appends [REVIEWER RISK — ...] flags to the relevant
             # sections but never rewrites body content.
-            if agency_loader.requirements.agency == "NSF":
-                yield f"data: {json.dumps({'type': 'status', 'message': 'Running NSF seven-criteria fit check...'})}\n\n"
-                ordered_names = [s_req.name for _k, s_req in agency_loader.get_ordered_sections()]
-                section_list = [sections[n] for n in ordered_names if n in sections]
-                checked_list = agent._check_nsf_criteria(section_list)
+            if requirements.agency == "NSF":
+                yield _sse({'type': 'status', 'message': 'Running NSF seven-criteria fit check...'})
+                # sections is already keyed in agency order (see above).
+                checked_list = await asyncio.to_thread(agent._check_nsf_criteria, list(sections.values()))
                 sections = {s.name: s for s in checked_list}
 
-            yield f"data: {json.dumps({'type': 'status', 'message': 'Creating proposal document...'})}\n\n"
+            yield _sse({'type': 'status', 'message': 'Creating proposal document...'})
 
             # Create proposal
             proposal = create_proposal_from_sections(
-                company_name=agent.company_context.company_name,
+                company_name=company_context.company_name,
                 sections=sections,
                 agency_loader=agency_loader
             )
 
-            proposal.grant_type = f"{agency_loader.requirements.agency} {agency_loader.requirements.program}"
+            proposal.grant_type = f"{requirements.agency} {requirements.program}"
             proposal.calculate_totals()
             proposal.total_cost = cost_tracker.get_total_cost()
             proposal.generation_time_seconds = time.time() - start_time
 
-            yield f"data: {json.dumps({'type': 'status', 'message': 'Running quality checks...'})}\n\n"
+            yield _sse({'type': 'status', 'message': 'Running quality checks...'})
 
             # Quality check
-            validation_results = quality_checker.validate_proposal(proposal, agent.company_context)
+            validation_results = quality_checker.validate_proposal(proposal, company_context)
 
-            yield f"data: {json.dumps({'type': 'status', 'message': 'Exporting to Word document...'})}\n\n"
+            yield _sse({'type': 'status', 'message': 'Exporting to Word document...'})
 
             # Export
-            output_file = exporter.create_document(proposal)
+            # Kept in memory for /download — nothing else reads the file, and
+            # the instance disk is ephemeral anyway.
+            output_file = exporter.document_filename(proposal)
+            output_bytes = await asyncio.to_thread(exporter.create_document_bytes, proposal)
 
             # Store proposal in-memory for the /results page.
             app_state.proposals[user['username']] = {
                 'proposal': proposal,
                 'quality_report': validation_results,
                 'output_file': output_file,
+                'output_bytes': output_bytes,
                 'sections': sections,
                 'generated_at': datetime.now().isoformat()
             }
@@ -924,7 +1000,7 @@ async def generate_stream(request: Request, agency: str = "nsf"):
                     }
                     saved = save_proposal(
                         user_id=user_id_for_save,
-                        proposal_type=agency_loader.requirements.agency,
+                        proposal_type=requirements.agency,
                         sections=sections_payload,
                         status="complete",
                         expert_review_requested=expert_review_requested,
@@ -935,7 +1011,7 @@ async def generate_stream(request: Request, agency: str = "nsf"):
                     log.exception("generate_stream: save_proposal failed: %s", save_exc)
 
             # Final result
-            yield f"data: {json.dumps({'type': 'complete', 'total_words': proposal.total_word_count, 'total_cost': f'${proposal.total_cost:.2f}', 'generation_time': f'{proposal.generation_time_seconds:.1f}s', 'output_file': output_file, 'proposal_id': saved_proposal_id})}\n\n"
+            yield _sse({'type': 'complete', 'total_words': proposal.total_word_count, 'total_cost': f'${proposal.total_cost:.2f}', 'generation_time': f'{proposal.generation_time_seconds:.1f}s', 'output_file': output_file, 'proposal_id': saved_proposal_id})
 
             # Deduct 1 credit after successful generation (admin "Grant" exempt)
             _deduct_uid = request.session.get("user_id")
@@ -943,7 +1019,7 @@ async def generate_stream(request: Request, agency: str = "nsf"):
                 deduct_credit(_deduct_uid)
 
         except Exception as e:
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+            yield _sse({'type': 'error', 'message': str(e)})
 
     return StreamingResponse(
         event_generator(),
@@ -1007,21 +1083,15 @@ def create_proposal_from_sections(company_name: str, sections: dict, agency_load
     "Technology Innovation", "Market Opportunity"). Missing sections fall
     back to an empty placeholder so the proposal stays complete.
     """
-    ordered = agency_loader.get_ordered_sections()
-    proposal_sections: list = []
-    for _key, section_req in ordered:
-        section = sections.get(section_req.name)
-        if section is None:
-            section = GrantSection(
-                name=section_req.name,
-                content="[Section not generated]",
-                word_count=0,
-            )
-        proposal_sections.append(section)
-
+    # Placeholders are built per proposal rather than shared: GrantSection is
+    # mutable and the admin editor / quality checker may touch sections later.
     return GrantProposal(
         company_name=company_name,
-        sections=proposal_sections,
+        sections=[
+            sections[req.name] if req.name in sections
+            else GrantSection(name=req.name, content="[Section not generated]", word_count=0)
+            for _key, req in agency_loader.get_ordered_sections()
+        ],
     )
 
 
@@ -1051,14 +1121,16 @@ async def download_file(request: Request, filename: str):
     if not proposal_data:
         raise HTTPException(status_code=404, detail="No proposal found")
 
-    file_path = Path(proposal_data['output_file'])
-    if not file_path.exists():
+    content = proposal_data.get('output_bytes')
+    if content is None:
         raise HTTPException(status_code=404, detail="File not found")
 
-    return FileResponse(
-        path=file_path,
-        filename=file_path.name,
-        media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+    return Response(
+        content=content,
+        media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        headers={
+            "Content-Disposition": f"attachment; filename*=utf-8''{urllib.parse.quote(proposal_data['output_file'])}",
+        },
     )
 
 
@@ -1110,6 +1182,10 @@ def _stripe_checkout_for(request: Request, product_key: str) -> RedirectResponse
         )
 
     request.session["product"] = product_key
+    # Stripe is only needed on the payment routes; importing it lazily (like
+    # resend) keeps it off the startup path for every other page.
+    import stripe
+    stripe.api_key = Config.STRIPE_SECRET_KEY
     try:
         customer = stripe.Customer.create(metadata={'username': user['username']})
         checkout_session = stripe.checkout.Session.create(
@@ -1129,6 +1205,9 @@ def _stripe_checkout_for(request: Request, product_key: str) -> RedirectResponse
         raise HTTPException(status_code=400, detail=str(e))
 
 
+_PATH_SEPARATORS = str.maketrans({"/": "_", "\\": "_"})
+
+
 async def _validate_and_store_invitation_letter(
     invitation_letter: UploadFile, user_id: Optional[str], *, context: str
 ) -> tuple[str, str]:
@@ -1142,13 +1221,19 @@ async def _validate_and_store_invitation_letter(
     if (invitation_letter.content_type or "").lower() != "application/pdf":
         raise HTTPException(status_code=400, detail="Invitation letter must be a PDF.")
 
+    max_bytes = 10 * 1024 * 1024
+    # Starlette records the spooled upload's size; reject oversized files
+    # before pulling the whole thing into memory.
+    if invitation_letter.size is not None and invitation_letter.size > max_bytes:
+        raise HTTPException(status_code=413, detail="Invitation letter must be under 10 MB.")
+
     raw = await invitation_letter.read()
     if not raw:
         raise HTTPException(status_code=400, detail="Invitation letter file is empty.")
-    if len(raw) > 10 * 1024 * 1024:
+    if len(raw) > max_bytes:
         raise HTTPException(status_code=413, detail="Invitation letter must be under 10 MB.")
 
-    safe_name = (invitation_letter.filename or "invitation.pdf").replace("/", "_").replace("\\", "_")
+    safe_name = (invitation_letter.filename or "invitation.pdf").translate(_PATH_SEPARATORS)
     object_path = (
         f"{user_id or 'anon'}/"
         f"{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S')}_"
@@ -1319,6 +1404,8 @@ async def payment_success(request: Request, session_id: str = None):
     user_id = request.session.get("user_id")
 
     if session_id and Config.STRIPE_SECRET_KEY:
+        import stripe
+        stripe.api_key = Config.STRIPE_SECRET_KEY
         try:
             session = stripe.checkout.Session.retrieve(session_id)
             if session.payment_status == 'paid':
@@ -1371,6 +1458,7 @@ async def stripe_webhook(request: Request):
     if not Config.STRIPE_WEBHOOK_SECRET:
         raise HTTPException(status_code=500, detail="Webhook secret not configured")
 
+    import stripe
     try:
         event = stripe.Webhook.construct_event(
             payload, sig_header, Config.STRIPE_WEBHOOK_SECRET
@@ -1839,17 +1927,16 @@ async def admin_proposal_save(
 
     sections = proposal.get("sections") or {}
     for name, text in updated_text.items():
-        if name in sections and isinstance(sections[name], dict):
-            sections[name]["content"] = text
-            sections[name]["char_count"] = len(text)
-            sections[name]["word_count"] = len(text.split()) if text.strip() else 0
+        edited = {
+            "content": text,
+            "char_count": len(text),
+            "word_count": len(text.split()),
+        }
+        existing = sections.get(name)
+        if isinstance(existing, dict):
+            existing.update(edited)
         else:
-            sections[name] = {
-                "name": name,
-                "content": text,
-                "char_count": len(text),
-                "word_count": len(text.split()) if text.strip() else 0,
-            }
+            sections[name] = {"name": name, **edited}
 
     update_proposal_sections_admin(proposal_id, sections)
     return RedirectResponse(